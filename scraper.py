@@ -1,21 +1,363 @@
+import asyncio
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import pandas as pd
+from bs4.dammit import EncodingDetector
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 import time
 import random
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlencode
+from urllib.robotparser import RobotFileParser
 import logging
 import csv
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from datetime import datetime
 import re
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterable, Iterator, AsyncIterator, Callable
 import sys
-import threading
 import os
+import socket
+import sqlite3
+import threading
+import functools
+import itertools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+_CURRENCY_RE = re.compile(r'[^\d.,]')
+_HTTP_PREFIXES = ('https://', 'http://')
+
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache: Dict[tuple, tuple] = {}
+_dns_cache_ttl = 300
+_DNS_CACHE_MAXSIZE = 256
+_dns_cache_lock = threading.Lock()
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """Resolve a host through socket.getaddrinfo, reusing results until they expire"""
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    entry = _dns_cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+    
+    result = _original_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_cache_lock:
+        if key not in _dns_cache and len(_dns_cache) >= _DNS_CACHE_MAXSIZE:
+            # Evict the oldest entry
+            _dns_cache.pop(next(iter(_dns_cache)), None)
+        _dns_cache[key] = (now + _dns_cache_ttl, result)
+    return result
+
+def enable_dns_cache(ttl: int = 300):
+    """
+    Cache DNS lookups made through socket.getaddrinfo for the whole process
+    
+    This replaces socket.getaddrinfo, so it affects every library in the process,
+    not just the scraper. There is one cache and one TTL: the most recent call sets
+    the TTL for all lookups, including those made by other WebScraper instances.
+    
+    Args:
+        ttl (int): Seconds a resolved address is reused before looking it up again
+    """
+    global _dns_cache_ttl
+    _dns_cache_ttl = ttl
+    socket.getaddrinfo = _cached_getaddrinfo
+
+def disable_dns_cache():
+    """Restore the original socket.getaddrinfo and drop any cached lookups"""
+    if socket.getaddrinfo is _cached_getaddrinfo:
+        socket.getaddrinfo = _original_getaddrinfo
+    with _dns_cache_lock:
+        _dns_cache.clear()
+
+@functools.lru_cache(maxsize=256)
+def _css(selector: str) -> CSSSelector:
+    """Compile a CSS selector, reusing it across pages in the same process"""
+    return CSSSelector(selector)
+
+def _remove_whitespace(value: Any) -> str:
+    return ' '.join(str(value).split())
+
+def _remove_currency(value: Any) -> str:
+    return _CURRENCY_RE.sub('', str(value))
+
+def _convert_to_float(value: Any) -> Optional[float]:
+    try:
+        return float(str(value).replace(',', ''))
+    except ValueError:
+        return None
+
+def _convert_to_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(str(value).replace(',', '')))
+    except ValueError:
+        return None
+
+# Cleaning rule names and the order they are applied in
+_CLEANING_STEPS = (
+    ('remove_whitespace', _remove_whitespace),
+    ('remove_currency', _remove_currency),
+    ('convert_to_float', _convert_to_float),
+    ('convert_to_int', _convert_to_int),
+)
+
+def _rule_cleaners(rule: Dict) -> tuple:
+    """Return the cleaning steps a field's rule enables, in application order"""
+    return tuple(step for name, step in _CLEANING_STEPS if rule.get(name, False))
+
+def _apply_cleaners(value: Any, cleaners: tuple) -> Any:
+    """Run a value through cleaning steps, stopping once a conversion fails"""
+    for clean in cleaners:
+        value = clean(value)
+        if value is None:
+            break
+    return value
+
+def _compile_selectors(selectors: Dict, cleaning_rules: Optional[Dict] = None) -> tuple:
+    """
+    Compile CSS selectors and cleaning rules once so they aren't re-parsed for every item
+    
+    Args:
+        selectors (dict): Dictionary of CSS selectors for data extraction
+        cleaning_rules (dict): Rules for cleaning each field
+        
+    Returns:
+        Tuple of (item selector, fields), where fields is a tuple of
+        (key, selector, attribute, is_link, cleaners) entries in selector order
+    """
+    cleaning_rules = cleaning_rules or {}
+    fields = []
+    for key, selector in selectors.items():
+        if key == 'item_selector':
+            continue
+        rule = cleaning_rules.get(key, {})
+        cleaners = _rule_cleaners(rule)
+        if isinstance(selector, dict):
+            attribute = selector.get('attribute')
+            fields.append((key, _css(selector.get('selector', '')), attribute, attribute in ('href', 'src'), cleaners))
+        else:
+            fields.append((key, _css(selector), None, False, cleaners))
+    return _css(selectors.get('item_selector', '')), tuple(fields)
+
+@functools.lru_cache(maxsize=16)
+def _html_parser(encoding: str) -> lxml.html.HTMLParser:
+    """Create an HTML parser for a declared encoding, reused across pages"""
+    return lxml.html.HTMLParser(encoding=encoding)
+
+def _guess_encodings(content: bytes) -> Iterator[str]:
+    """
+    Yield likely encodings for a body whose response named none, best guess first
+    
+    Follows BeautifulSoup's detection order (byte order mark, then <meta> charset,
+    then UTF-8 and Windows-1252) without its chardet pass over the whole page.
+    
+    Args:
+        content (bytes): Raw page content
+    """
+    _, bom_encoding = EncodingDetector.strip_byte_order_mark(content)
+    if bom_encoding:
+        yield bom_encoding
+    declared = EncodingDetector.find_declared_encoding(content, is_html=True)
+    if declared:
+        yield declared
+    try:
+        content.decode('utf-8')
+    except UnicodeDecodeError:
+        yield 'windows-1252'
+    else:
+        yield 'utf-8'
+
+def _parse_tree(content: bytes, encoding: Optional[str] = None) -> Optional[lxml.html.HtmlElement]:
+    """
+    Parse raw page content into an lxml tree
+    
+    lxml builds a much lighter tree than BeautifulSoup, so it is used for the
+    scraping hot path while get_page_content keeps returning BeautifulSoup.
+    
+    Args:
+        content (bytes): Raw page content
+        encoding (str): Encoding declared by the server, None to detect it from the content
+        
+    Returns:
+        Root element of the page or None if the page is empty
+    """
+    if not content.strip():
+        return None
+    # libxml2 reads undeclared bytes as Latin-1, so always hand it an encoding
+    candidates = [encoding] if encoding else []
+    parser = None
+    for candidate in itertools.chain(candidates, _guess_encodings(content)):
+        try:
+            parser = _html_parser(candidate)
+            break
+        except LookupError:
+            continue  # Unknown encoding name, try the next guess
+    try:
+        return lxml.html.fromstring(content, parser=parser)
+    except etree.ParserError:
+        return None  # No elements at all, e.g. only a doctype or comments
+
+def _extract_items(tree: lxml.html.HtmlElement, selectors: tuple, base_url: str) -> List[Dict]:
+    """
+    Extract item data from a parsed page using compiled CSS selectors
+    
+    Args:
+        tree (lxml.html.HtmlElement): Parsed page
+        selectors (tuple): Compiled selectors from _compile_selectors
+        base_url (str): Base URL used to make links absolute
+        
+    Returns:
+        List of dictionaries containing the extracted items
+    """
+    item_selector, fields = selectors
+    data = []
+    for item in item_selector(tree):
+        item_data = {}
+        for key, selector, attribute, is_link, cleaners in fields:
+            elements = selector(item)
+            if not elements:
+                item_data[key] = None
+                continue
+            
+            if attribute:
+                value = elements[0].get(attribute, '').strip()
+                # Make URLs absolute if they're links
+                if is_link and value and not value.startswith(_HTTP_PREFIXES):
+                    try:
+                        value = urljoin(base_url, value)
+                    except ValueError:
+                        value = ""  # Malformed link, e.g. an unclosed IPv6 bracket
+            else:
+                value = elements[0].text_content().strip()
+            
+            # Clean while extracting so no second copy of the data is built
+            item_data[key] = _apply_cleaners(value, cleaners)
+        
+        data.append(item_data)
+    
+    return data
+
+def _parse_page(content: bytes, encoding: Optional[str], selectors: Dict, cleaning_rules: Optional[Dict],
+                base_url: str, next_selector: Optional[str] = None) -> tuple:
+    """
+    Parse a page and extract its items
+    
+    Runs in a worker process, so it takes the raw selectors dict and returns plain
+    dictionaries; only small, picklable values cross the process boundary.
+    
+    Args:
+        content (bytes): Raw page content
+        encoding (str): Encoding declared by the server, if any
+        selectors (dict): Dictionary of CSS selectors for data extraction
+        cleaning_rules (dict): Rules for cleaning each field
+        base_url (str): Base URL used to make links absolute
+        next_selector (str): CSS selector for the next page link, if any
+        
+    Returns:
+        Tuple of (extracted items, next page href or None)
+    """
+    tree = _parse_tree(content, encoding)
+    if tree is None:
+        return [], None
+    
+    items = _extract_items(tree, _compile_selectors(selectors, cleaning_rules), base_url)
+    next_link = None
+    if next_selector:
+        next_buttons = _css(next_selector)(tree)
+        if next_buttons:
+            next_link = next_buttons[0].get('href')
+    return items, next_link
+
+def _declared_charset(content_type: str) -> Optional[str]:
+    """Return the charset named in a Content-Type header, or None if it doesn't name one"""
+    for param in content_type.split(';')[1:]:
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'charset':
+            return value.strip().strip('"\'') or None
+    return None
+
+def _dump_json_row(row: Dict) -> bytes:
+    """
+    Serialize one row as an indented element of a JSON array
+    
+    Uses orjson when it is installed and falls back to the standard library.
+    """
+    if orjson is not None:
+        text = orjson.dumps(row, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        text = json.dumps(row, indent=2, ensure_ascii=False).encode('utf-8')
+    return b'  ' + text.replace(b'\n', b'\n  ')
+
+class _ResponseCache:
+    """
+    On-disk cache of response bodies keyed by URL and query parameters
+    
+    The connection is shared between threads (async scrapes may run on a worker
+    thread and do their cache I/O in the loop's executor), so every access holds a lock.
+    """
+    
+    # Bump whenever the responses table changes
+    SCHEMA_VERSION = 1
+    
+    def __init__(self, path: str, expire_after: Optional[float] = 3600):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            path (str): Path to the SQLite file
+            expire_after (float): Seconds before a cached response is fetched again, None to never expire
+        """
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # Files written with an older layout are discarded rather than migrated
+        if self._db.execute('PRAGMA user_version').fetchone()[0] != self.SCHEMA_VERSION:
+            self._db.execute('DROP TABLE IF EXISTS responses')
+            self._db.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses '
+            '(key TEXT PRIMARY KEY, content BLOB, encoding TEXT, final_url TEXT, stored_at REAL)'
+        )
+        self._db.commit()
+    
+    @staticmethod
+    def _key(url: str, params: Optional[Dict]) -> str:
+        return f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    
+    def get(self, url: str, params: Optional[Dict] = None) -> Optional[tuple]:
+        """Return (content, encoding, final URL) for a fresh cached response, or None"""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT content, encoding, final_url, stored_at FROM responses WHERE key = ?', (self._key(url, params),)
+            ).fetchone()
+        if row is None or (self.expire_after is not None and time.time() - row[3] > self.expire_after):
+            return None
+        return row[0], row[1], row[2]
+    
+    def set(self, url: str, params: Optional[Dict], content: bytes, encoding: Optional[str], final_url: str):
+        """Store a response body along with the URL it was served from after redirects"""
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                (self._key(url, params), content, encoding, final_url, time.time())
+            )
+            self._db.commit()
+    
+    def close(self):
+        with self._lock:
+            self._db.close()
 
 class WebScraper:
-    def __init__(self, delay_range=(1, 3), timeout=10, max_retries=3, proxies=None, log_file=None):
+    def __init__(self, delay_range=(1, 3), timeout=10, max_retries=3, proxies=None, log_file=None,
+                 max_concurrency=5, dns_cache_ttl=None, cache=False, cache_expire_after=3600):
         """
         Initialize the web scraper with configurable parameters
         
@@ -25,21 +367,55 @@ class WebScraper:
             max_retries (int): Maximum number of retries for failed requests
             proxies (dict): Proxy configuration for requests
             log_file (str): Path to log file
+            max_concurrency (int): Maximum number of pages fetched concurrently
+            dns_cache_ttl (int): Seconds to cache DNS lookups process-wide (see enable_dns_cache),
+                None (the default) to leave socket.getaddrinfo untouched
+            cache (bool): Keep fetched pages in scraper_cache.sqlite and reuse them on reruns
+            cache_expire_after (int): Seconds before a cached page is fetched again, None to never expire
         """
         self.delay_range = delay_range
         self.timeout = timeout
         self.max_retries = max_retries
         self.proxies = proxies
+        self.max_concurrency = max_concurrency
+        self.dns_cache_ttl = dns_cache_ttl
+        self._parse_pool: Optional[ProcessPoolExecutor] = None  # Started by the first scrape
         self.scraping = False
         self.current_page = 0
         self.total_items = 0
+        self._last_progress = 0.0
+        self._host_next_ok: Dict[str, float] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._robots: Dict[str, RobotFileParser] = {}
+        self._cache = _ResponseCache('scraper_cache.sqlite', cache_expire_after) if cache else None
         
         # Setup session
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive'
         })
         
+        # Keep connections alive across pages and let urllib3 retry failed requests
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=max(self.max_retries - 1, 0),
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Reuse resolved addresses instead of hitting the resolver on every request.
+        # This patches socket.getaddrinfo for the whole process until close()
+        if dns_cache_ttl:
+            enable_dns_cache(dns_cache_ttl)
+        
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
@@ -47,6 +423,8 @@ class WebScraper:
             handlers=[logging.StreamHandler()]
         )
         self.logger = logging.getLogger(__name__)
+        # httpx logs every request at INFO; the scraper reports its own progress
+        logging.getLogger('httpx').setLevel(logging.WARNING)
         
         if log_file:
             file_handler = logging.FileHandler(log_file)
@@ -57,6 +435,42 @@ class WebScraper:
         """Generate a random delay within the specified range"""
         return random.uniform(*self.delay_range)
     
+    def _reserve_request_slot(self, url: str) -> float:
+        """
+        Schedule the next request to a URL's host
+        
+        Requests to the same host are spaced by a random delay, while requests to
+        other hosts are not held up.
+        
+        Args:
+            url (str): URL about to be requested
+            
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        host = urlparse(url).netloc
+        now = time.monotonic()
+        start = max(now, self._host_next_ok.get(host, 0.0))
+        self._host_next_ok[host] = start + self.get_random_delay()
+        return start - now
+    
+    async def _wait_for_request_slot(self, url: str):
+        """
+        Wait until a URL's host may be requested again, then book the slot
+        
+        Waiters for the same host take turns in arrival order, and a slot is only
+        booked once its request is about to go out, so a waiter that is cancelled
+        never delays the requests after it.
+        
+        Args:
+            url (str): URL about to be requested
+        """
+        host = urlparse(url).netloc
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            await asyncio.sleep(max(0.0, self._host_next_ok.get(host, 0.0) - time.monotonic()))
+            self._reserve_request_slot(url)
+    
     def is_valid_url(self, url: str) -> bool:
         """
         Check if a URL is valid
@@ -67,8 +481,16 @@ class WebScraper:
         Returns:
             bool: True if URL is valid, False otherwise
         """
+        # Fast path for the common case of a lowercase http(s) URL; IPv6 brackets and
+        # non-ASCII hosts can be malformed in ways only urlsplit detects
+        if isinstance(url, str) and url.isascii() and '[' not in url and ']' not in url:
+            for prefix in _HTTP_PREFIXES:
+                if url.startswith(prefix):
+                    netloc_start = url[len(prefix):len(prefix) + 1]
+                    return bool(netloc_start) and netloc_start not in '/?#'
+        
         try:
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
             if not all([parsed.scheme, parsed.netloc]):
                 return False
             # Check if scheme is http or https
@@ -90,11 +512,7 @@ class WebScraper:
         if not relative_url:
             return ""
         
-        # If URL is already absolute, return it
-        if self.is_valid_url(relative_url):
-            return relative_url
-        
-        # Convert relative URL to absolute
+        # Convert relative URL to absolute; urljoin leaves absolute URLs untouched
         try:
             return urljoin(base_url, relative_url)
         except:
@@ -102,7 +520,7 @@ class WebScraper:
     
     def get_page_content(self, url: str, params: Optional[Dict] = None) -> Optional[BeautifulSoup]:
         """
-        Retrieve content from a URL with retry logic
+        Retrieve content from a URL, retrying failed requests through the session adapter
         
         Args:
             url (str): URL to scrape
@@ -111,41 +529,150 @@ class WebScraper:
         Returns:
             BeautifulSoup object or None if failed
         """
+        fetched = self._download(url, params)
+        if fetched is None:
+            return None
+        
+        # A declared charset is trusted as is; otherwise BeautifulSoup sniffs the
+        # <meta> tag itself, which is far cheaper than a chardet pass over the body
+        content, encoding, _ = fetched
+        return BeautifulSoup(content, 'lxml', from_encoding=encoding)
+    
+    def _download(self, url: str, params: Optional[Dict] = None) -> Optional[tuple]:
+        """
+        Retrieve the raw body of a URL, retrying failed requests through the session adapter
+        
+        Args:
+            url (str): URL to scrape
+            params (dict): Query parameters for the request
+            
+        Returns:
+            Tuple of (response body, encoding declared by the server or None, final URL
+            after redirects), or None if failed
+        """
         if not self.is_valid_url(url):
             self.logger.error(f"Invalid URL: {url}")
             return None
         
+        if self._cache is not None:
+            cached = self._cache.get(url, params)
+            if cached is not None:
+                return cached
+        
+        # Respect rate limiting
+        time.sleep(self._reserve_request_slot(url))
+        
+        try:
+            response = self.session.get(
+                url, 
+                params=params, 
+                timeout=self.timeout,
+                proxies=self.proxies
+            )
+            response.raise_for_status()
+            
+            # Only the header's charset counts; response.encoding falls back to
+            # ISO-8859-1 for any text/* response that doesn't name one
+            encoding = _declared_charset(response.headers.get('Content-Type', ''))
+            
+            if self._cache is not None:
+                self._cache.set(url, params, response.content, encoding, response.url)
+            
+            return response.content, encoding, response.url
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Failed to retrieve {url} after {self.max_retries} attempts: {e}")
+            return None
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        """
+        Create the HTTP/2 client used for page fetches while scraping
+        
+        Requests to the same host are multiplexed over a single connection. Only the
+        User-Agent is copied from the session, since HTTP/2 forbids connection headers.
+        
+        Returns:
+            httpx.AsyncClient: Client bound to the running event loop
+        """
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        mounts = {
+            pattern if '://' in pattern else f"{pattern}://": httpx.AsyncHTTPTransport(
+                http2=True, limits=limits, proxy=proxy
+            )
+            for pattern, proxy in (self.proxies or {}).items()
+        }
+        return httpx.AsyncClient(
+            http2=True,
+            limits=limits,
+            mounts=mounts,
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={'User-Agent': self.session.headers['User-Agent']}
+        )
+    
+    async def aclose(self):
+        """Close the HTTP/2 client if a scrape left one open"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch_bytes(self, url: str, params: Optional[Dict] = None) -> Optional[tuple]:
+        """
+        Asynchronously retrieve raw page content with retry logic
+        
+        Only does network I/O; parsing is left to the caller so it can be scheduled
+        separately, e.g. in the parsing process pool.
+
+        Args:
+            url (str): URL to scrape
+            params (dict): Query parameters for the request
+
+        Returns:
+            Tuple of (response body, encoding declared by the server or None, final URL
+            after redirects), or None if failed
+        """
+        # Cache reads and writes go through the executor so sqlite never blocks the loop
+        loop = asyncio.get_running_loop()
+        if self._cache is not None:
+            cached = await loop.run_in_executor(None, self._cache.get, url, params)
+            if cached is not None:
+                return cached
+        
         for attempt in range(self.max_retries):
+            # Respect rate limiting without blocking requests to other hosts
+            await self._wait_for_request_slot(url)
+
             try:
                 self.logger.debug(f"Attempt {attempt + 1} to retrieve {url}")
-                response = self.session.get(
-                    url, 
-                    params=params, 
-                    timeout=self.timeout,
-                    proxies=self.proxies
-                )
+                async with self._semaphore:
+                    response = await self._client.get(url, params=params)
                 response.raise_for_status()
-                
-                # Detect encoding if not specified
-                if response.encoding is None:
-                    response.encoding = response.apparent_encoding
-                
-                # Respect robots.txt and rate limiting
-                time.sleep(self.get_random_delay())
-                
-                return BeautifulSoup(response.content, 'html.parser')
-                
-            except requests.exceptions.RequestException as e:
+                final_url = str(response.url)
+                if self._cache is not None:
+                    await loop.run_in_executor(
+                        None, self._cache.set, url, params, response.content, response.charset_encoding, final_url
+                    )
+                return response.content, response.charset_encoding, final_url
+
+            except httpx.InvalidURL as e:
+                # Not an HTTPError, and retrying can't fix the URL
+                self.logger.error(f"Invalid URL {url!r}: {e}")
+                return None
+
+            except httpx.HTTPError as e:
                 self.logger.warning(f"Attempt {attempt + 1} failed: {e}")
                 if attempt == self.max_retries - 1:
                     self.logger.error(f"Failed to retrieve {url} after {self.max_retries} attempts")
                     return None
-                time.sleep(self.get_random_delay() * 2)  # Longer delay after failure
-    
+                await asyncio.sleep(2 ** attempt * self.get_random_delay())  # Back off after failure
+
     def clean_data(self, data: List[Dict], cleaning_rules: Optional[Dict] = None) -> List[Dict]:
         """
         Clean scraped data based on rules
         
+        Scraping already applies cleaning rules while extracting each item, so this
+        is only needed for data gathered some other way.
+        
         Args:
             data (list): Scraped data
             cleaning_rules (dict): Rules for cleaning each field
@@ -153,49 +680,261 @@ class WebScraper:
         Returns:
             List of cleaned data
         """
-        if not cleaning_rules:
+        if not cleaning_rules or not data:
             return data
-            
+        
+        # Same cleaning steps, in the same order, as applied during extraction
+        cleaners = {key: _rule_cleaners(rule) for key, rule in cleaning_rules.items()}
         cleaned_data = []
         for item in data:
-            cleaned_item = {}
-            for key, value in item.items():
-                if key in cleaning_rules and value is not None:
-                    rule = cleaning_rules[key]
-                    # Remove extra whitespace
-                    if rule.get('remove_whitespace', False):
-                        value = ' '.join(str(value).split())
-                    # Remove currency symbols
-                    if rule.get('remove_currency', False):
-                        value = re.sub(r'[^\d.,]', '', str(value))
-                    # Convert to float
-                    if rule.get('convert_to_float', False):
-                        try:
-                            value = float(str(value).replace(',', ''))
-                        except ValueError:
-                            value = None
-                    # Convert to integer
-                    if rule.get('convert_to_int', False):
-                        try:
-                            value = int(float(str(value).replace(',', '')))
-                        except ValueError:
-                            value = None
-                cleaned_item[key] = value
+            cleaned_item = dict(item)
+            for key, steps in cleaners.items():
+                if cleaned_item.get(key) is not None:
+                    cleaned_item[key] = _apply_cleaners(cleaned_item[key], steps)
             cleaned_data.append(cleaned_item)
         
         return cleaned_data
     
-    def display_progress(self):
-        """Display live progress information in the console"""
-        while self.scraping:
-            sys.stdout.write(f"\rScraping page {self.current_page}, Items collected: {self.total_items}")
-            sys.stdout.flush()
-            time.sleep(0.1)
+    def display_progress(self, force: bool = False):
+        """
+        Display live progress information in the console
+        
+        Called by the scrape loop whenever the progress changes; updates are
+        throttled to one every 200 ms unless forced.
+        
+        Args:
+            force (bool): Print even if the last update was less than 200 ms ago
+        """
+        now = time.monotonic()
+        if not force and now - self._last_progress < 0.2:
+            return
+        self._last_progress = now
+        sys.stdout.write(f"\rScraping page {self.current_page}, Items collected: {self.total_items}")
+        sys.stdout.flush()
     
+    def _page_request_builder(self, url: str, pagination: Optional[Dict]) -> Callable[[int], tuple]:
+        """
+        Pick how numbered page requests are built, once per scrape
+
+        Args:
+            url (str): Base URL to scrape
+            pagination (dict): Pagination configuration
+
+        Returns:
+            Function mapping a page number to a tuple of (page URL, query parameters)
+        """
+        pattern = pagination.get('url_pattern', '') if pagination else ''
+
+        if not pagination:
+            build = lambda page_num: (url, None)
+        elif pattern and self.is_valid_url(pattern.format(page=1)):
+            # Absolute pattern, no joining needed
+            build = lambda page_num: (pattern.format(page=page_num), None)
+        elif pattern:
+            build = lambda page_num: (urljoin(url, pattern.format(page=page_num)), None)
+        else:
+            base_params = pagination.get('params', {})
+            page_param = pagination.get('page_param', 'page')
+            build = lambda page_num: (url, {**base_params, page_param: page_num})
+
+        # The first page is always the base URL itself
+        return lambda page_num: (url, None) if page_num == 1 else build(page_num)
+
+    async def _scrape_pages(self, url: str, selectors: Dict, pagination: Optional[Dict],
+                            limit_pages: Optional[int], cleaning_rules: Optional[Dict]) -> AsyncIterator[tuple]:
+        """
+        Scrape pages with a fresh HTTP/2 client, picking the pagination strategy
+
+        URL pattern and query parameter pagination is fetched concurrently, while
+        next button pagination is followed page by page.
+
+        Args:
+            url (str): Base URL to scrape
+            selectors (dict): Dictionary of CSS selectors for data extraction
+            pagination (dict): Pagination configuration if applicable
+            limit_pages (int): Maximum number of pages to scrape
+            cleaning_rules (dict): Rules for cleaning the scraped data
+
+        Yields:
+            Tuple of (page number, items scraped from that page)
+        """
+        self._client = self._create_async_client()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._host_locks = {}
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+        if pagination and not pagination.get('next_selector'):
+            pages = self._scrape_numbered_pages(url, selectors, pagination, limit_pages, cleaning_rules)
+        else:
+            pages = self._scrape_linked_pages(url, selectors, pagination, limit_pages, cleaning_rules)
+
+        try:
+            async for page in pages:
+                yield page
+        finally:
+            await pages.aclose()
+            await self.aclose()
+
+    async def _scrape_numbered_pages(self, url: str, selectors: Dict, pagination: Dict,
+                                     limit_pages: Optional[int],
+                                     cleaning_rules: Optional[Dict]) -> AsyncIterator[tuple]:
+        """
+        Concurrently scrape pages whose URLs can be derived from the page number
+
+        When a page limit is set, every page is requested at once and pages are yielded
+        in order as they arrive. Without a limit, the first page is fetched on its own to
+        confirm the selectors match, then pages are requested in windows of
+        max_concurrency until a page comes back empty or fails.
+
+        Args:
+            url (str): Base URL to scrape
+            selectors (dict): Dictionary of CSS selectors for data extraction
+            pagination (dict): Pagination configuration
+            limit_pages (int): Maximum number of pages to scrape
+            cleaning_rules (dict): Rules for cleaning the scraped data
+
+        Yields:
+            Tuple of (page number, items scraped from that page)
+        """
+        loop = asyncio.get_running_loop()
+        page_request = self._page_request_builder(url, pagination)
+
+        async def scrape_page(page_num):
+            page_url, params = page_request(page_num)
+            self.logger.info(f"Scraping page {page_num}: {page_url}")
+            fetched = await self._fetch_bytes(page_url, params)
+            if fetched is None:
+                return None
+            # Parse in a worker process so parsing uses every core while pages keep downloading;
+            # links are resolved against the URL the page was actually served from
+            content, encoding, final_url = fetched
+            items, _ = await loop.run_in_executor(
+                self._parse_pool, _parse_page, content, encoding, selectors, cleaning_rules, final_url
+            )
+            return items
+
+        # With a page limit every page URL is known up front, so all requests are
+        # issued at once; otherwise page 1 is probed on its own first
+        start = 1
+        window = limit_pages if limit_pages is not None else 1
+        while limit_pages is None or start <= limit_pages:
+            stop = start + window if limit_pages is None else limit_pages + 1
+            tasks = [asyncio.ensure_future(scrape_page(page_num)) for page_num in range(start, stop)]
+
+            try:
+                # Hand pages over in order as soon as each one is ready
+                for page_num, task in zip(range(start, stop), tasks):
+                    items = await task
+                    if not items:
+                        if items is not None:
+                            self.logger.warning(f"No items found on page {page_num}")
+                        return
+                    yield page_num, items
+            finally:
+                # Drop requests for pages past an empty page or an early stop
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            start = stop
+            window = self.max_concurrency
+
+    async def _scrape_linked_pages(self, url: str, selectors: Dict, pagination: Optional[Dict],
+                                   limit_pages: Optional[int],
+                                   cleaning_rules: Optional[Dict]) -> AsyncIterator[tuple]:
+        """
+        Sequentially scrape a page and follow its next button links
+
+        Args:
+            url (str): Base URL to scrape
+            selectors (dict): Dictionary of CSS selectors for data extraction
+            pagination (dict): Pagination configuration if applicable
+            limit_pages (int): Maximum number of pages to scrape
+            cleaning_rules (dict): Rules for cleaning the scraped data
+
+        Yields:
+            Tuple of (page number, items scraped from that page)
+        """
+        loop = asyncio.get_running_loop()
+        next_selector = pagination['next_selector'] if pagination else None
+        page_num = 1
+        page_url = url
+
+        while limit_pages is None or page_num <= limit_pages:
+            self.logger.info(f"Scraping page {page_num}: {page_url}")
+
+            fetched = await self._fetch_bytes(page_url)
+            if fetched is None:
+                break
+
+            # Links are resolved against the URL the page was actually served from
+            content, encoding, page_url = fetched
+            items, next_link = await loop.run_in_executor(
+                self._parse_pool, _parse_page, content, encoding, selectors, cleaning_rules, page_url, next_selector
+            )
+
+            if not items:
+                self.logger.warning(f"No items found on page {page_num}")
+                break
+
+            yield page_num, items
+
+            # Check for next page
+            page_url = self.make_absolute_url(page_url, next_link)
+            if not self.is_valid_url(page_url):
+                break
+
+            page_num += 1
+
+    def _run_async_pages(self, pages: AsyncIterator[tuple]) -> Iterator[tuple]:
+        """
+        Drive an async page generator from synchronous code on a private event loop
+        
+        Each step runs as a task, so an interrupt such as Ctrl+C can cancel the step
+        in flight and let the generator close its client before the error propagates.
+        When called while another event loop is running in this thread (e.g. in
+        Jupyter or from an async application), the private loop is run in a worker
+        thread so the two don't clash.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            worker = None
+        else:
+            worker = ThreadPoolExecutor(max_workers=1)
+        
+        def run(awaitable):
+            if worker is None:
+                return loop.run_until_complete(awaitable)
+            return worker.submit(loop.run_until_complete, awaitable).result()
+        
+        step = None
+        try:
+            while True:
+                # The loop is idle between steps, so the task can be created from here
+                step = asyncio.ensure_future(pages.__anext__(), loop=loop)
+                try:
+                    yield run(step)
+                except StopAsyncIteration:
+                    break
+        finally:
+            if step is not None and not step.done():
+                loop.call_soon_threadsafe(step.cancel)
+                run(asyncio.wait([step]))
+            run(pages.aclose())
+            loop.close()
+            if worker is not None:
+                worker.shutdown()
+
     def scrape_website(self, url: str, selectors: Dict, pagination: Optional[Dict] = None, 
                       limit_pages: Optional[int] = None, cleaning_rules: Optional[Dict] = None) -> List[Dict]:
         """
         Scrape data from a website based on CSS selectors
+
+        URL pattern and query parameter pagination is fetched concurrently, while
+        next button pagination is followed page by page.
         
         Args:
             url (str): Base URL to scrape
@@ -207,133 +946,101 @@ class WebScraper:
         Returns:
             List of dictionaries containing scraped data
         """
+        return list(self.scrape_website_iter(url, selectors, pagination, limit_pages, cleaning_rules))
+
+    def scrape_website_iter(self, url: str, selectors: Dict, pagination: Optional[Dict] = None,
+                            limit_pages: Optional[int] = None,
+                            cleaning_rules: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Scrape data from a website, yielding items as each page is scraped
+
+        Takes the same arguments as scrape_website. Combined with export_data this
+        keeps memory flat no matter how many items are scraped.
+
+        Args:
+            url (str): Base URL to scrape
+            selectors (dict): Dictionary of CSS selectors for data extraction
+            pagination (dict): Pagination configuration if applicable
+            limit_pages (int): Maximum number of pages to scrape
+            cleaning_rules (dict): Rules for cleaning the scraped data
+
+        Yields:
+            Dictionaries containing scraped data
+        """
         if not self.is_valid_url(url):
             self.logger.error(f"Invalid URL: {url}")
-            return []
+            return
         
-        # Start progress display
         self.scraping = True
-        progress_thread = threading.Thread(target=self.display_progress)
-        progress_thread.daemon = True
-        progress_thread.start()
+        self.current_page = 0
+        self.total_items = 0
         
-        data = []
-        page_num = 1
-        has_next_page = True
+        pages = self._run_async_pages(
+            self._scrape_pages(url, selectors, pagination, limit_pages, cleaning_rules)
+        )
         
-        while has_next_page and (limit_pages is None or page_num <= limit_pages):
-            self.current_page = page_num
-            self.logger.info(f"Scraping page {page_num}: {url}")
-            
-            # Handle pagination
-            if pagination and page_num > 1:
-                page_url = pagination.get('url_pattern', '').format(page=page_num)
-                if page_url:
-                    params = None
-                else:
-                    params = pagination.get('params', {})
-                    params[pagination.get('page_param', 'page')] = page_num
-            else:
-                params = None
-                page_url = url
-            
-            full_url = urljoin(url, page_url) if page_url else url
-            soup = self.get_page_content(full_url, params)
-            
-            if not soup:
-                break
-            
-            # Extract data using selectors
-            items = soup.select(selectors.get('item_selector', ''))
-            
-            if not items:
-                self.logger.warning(f"No items found on page {page_num}")
-                break
-            
-            for item in items:
-                item_data = {}
-                for key, selector in selectors.items():
-                    if key == 'item_selector':
-                        continue
-                    
-                    # Handle different selector types
-                    if isinstance(selector, dict):
-                        # Complex selector with attributes
-                        element = item.select_one(selector.get('selector', ''))
-                        if element:
-                            if selector.get('attribute'):
-                                value = element.get(selector['attribute'], '').strip()
-                                # Make URLs absolute if they're links
-                                if selector.get('attribute') in ['href', 'src'] and value:
-                                    value = self.make_absolute_url(url, value)
-                            else:
-                                value = element.get_text().strip()
-                        else:
-                            value = None
-                    else:
-                        # Simple CSS selector
-                        element = item.select_one(selector)
-                        value = element.get_text().strip() if element else None
-                    
-                    item_data[key] = value
+        try:
+            for page_num, items in pages:
+                self.current_page = page_num
+                self.total_items += len(items)
+                self.display_progress()
                 
-                data.append(item_data)
-                self.total_items = len(data)
+                yield from items
+        finally:
+            pages.close()
+            self.scraping = False
+            self.display_progress(force=True)
+            print()  # New line after progress display
             
-            # Check for next page
-            if pagination:
-                next_selector = pagination.get('next_selector')
-                if next_selector:
-                    next_button = soup.select_one(next_selector)
-                    has_next_page = bool(next_button) and (limit_pages is None or page_num < limit_pages)
-                else:
-                    # Assume numeric pagination
-                    has_next_page = len(items) > 0 and (limit_pages is None or page_num < limit_pages)
-            else:
-                has_next_page = False
-            
-            page_num += 1
-        
-        # Stop progress display
-        self.scraping = False
-        time.sleep(0.2)  # Allow progress thread to finish
-        print()  # New line after progress display
-        
-        self.logger.info(f"Scraped {len(data)} items from {page_num - 1} pages")
-        
-        # Clean the data if rules are provided
-        if cleaning_rules:
-            data = self.clean_data(data, cleaning_rules)
-        
-        return data
+            self.logger.info(f"Scraped {self.total_items} items from {self.current_page} pages")
     
-    def export_data(self, data: List[Dict], filename: str, format: str = 'csv'):
+    def export_data(self, data: Iterable[Dict], filename: str, format: str = 'csv'):
         """
         Export scraped data to a file
         
+        Rows are written one at a time in every format, so data can be a generator
+        such as scrape_website_iter without ever holding every row in memory.
+        
         Args:
-            data (list): Data to export
+            data (iterable): Data to export
             filename (str): Output filename
             format (str): Export format ('csv', 'json', 'excel')
         """
-        if not data:
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
             self.logger.warning("No data to export")
             return
+        rows = itertools.chain([first], rows)
         
         try:
             if format == 'csv':
                 with open(f"{filename}.csv", 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=data[0].keys())
+                    writer = csv.DictWriter(f, fieldnames=first.keys())
                     writer.writeheader()
-                    writer.writerows(data)
+                    for row in rows:
+                        writer.writerow(row)
             
             elif format == 'json':
-                with open(f"{filename}.json", 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                with open(f"{filename}.json", 'wb') as f:
+                    # Same layout as json.dump(data, f, indent=2), one row at a time
+                    f.write(b'[')
+                    for i, row in enumerate(rows):
+                        f.write(b',\n' if i else b'\n')
+                        f.write(_dump_json_row(row))
+                    f.write(b'\n]')
             
             elif format == 'excel':
-                df = pd.DataFrame(data)
-                df.to_excel(f"{filename}.xlsx", index=False)
+                from openpyxl import Workbook
+                
+                # Write-only workbooks stream rows to disk instead of building every cell in memory
+                workbook = Workbook(write_only=True)
+                sheet = workbook.create_sheet('Sheet1')
+                fieldnames = list(first.keys())
+                sheet.append(fieldnames)
+                for row in rows:
+                    sheet.append([row.get(key) for key in fieldnames])
+                workbook.save(f"{filename}.xlsx")
             
             self.logger.info(f"Data exported to {filename}.{format}")
             
@@ -344,25 +1051,42 @@ class WebScraper:
         """
         Check if scraping is allowed by robots.txt
         
+        robots.txt is fetched once per site and the parsed rules are reused for
+        every later check against the same site.
+        
         Args:
             url (str): URL to check
             
         Returns:
             bool: True if scraping is allowed, False otherwise
         """
-        try:
-            parsed_url = urlparse(url)
-            robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
-            response = self.session.get(robots_url, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                robots_content = response.text
-                # Simple check - in production, use a proper robots.txt parser
-                if "User-agent: *" in robots_content and "Disallow: /" in robots_content:
-                    return False
-            return True
-        except:
-            return True  # Proceed if robots.txt can't be accessed
+        parsed_url = urlparse(url)
+        origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        
+        robots = self._robots.get(origin)
+        if robots is None:
+            robots = RobotFileParser(f"{origin}/robots.txt")
+            try:
+                response = self.session.get(robots.url, timeout=self.timeout)
+                robots.parse(response.text.splitlines() if response.status_code == 200 else [])
+            except:
+                robots.parse([])  # Proceed if robots.txt can't be accessed
+            self._robots[origin] = robots
+        
+        return robots.can_fetch(self.session.headers['User-Agent'], url)
+    
+    def close(self):
+        """
+        Shut down the worker processes used for parsing, close the response cache
+        and remove the DNS cache if this scraper enabled it
+        """
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None  # The next scrape starts a fresh pool
+        if self._cache is not None:
+            self._cache.close()
+        if self.dns_cache_ttl:
+            disable_dns_cache()
 
 def get_user_input():
     """Get website URL and configuration from user input"""
@@ -534,4 +1258,6 @@ if __name__ == "__main__":
             sys.exit(1)
         except Exception as e:
             print(f"\nAn error occurred: {e}")
-            scraper.logger.error(f"Scraping failed: {e}")
\ No newline at end of file
+            scraper.logger.error(f"Scraping failed: {e}")
+        finally:
+            scraper.close()
\ No newline at end of file